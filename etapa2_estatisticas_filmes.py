@@ -1,12 +1,19 @@
 # etapa2_estatisticas_filmes.py
 import json
-from collections import Counter
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import compress
 from typing import List, Dict, Tuple, Any
 
+def _duracao_em_minutos(duracao_tuple: Tuple[int, int]) -> int:
+    """Converte tupla (horas, minutos) para minutos totais"""
+    return duracao_tuple[0] * 60 + duracao_tuple[1]
+
 class EstatisticasFilmes:
     def __init__(self, arquivo_json: str = "catalogo_filmes.json"):
         self.arquivo_json = arquivo_json
         self.filmes = self.carregar_dados()
+        self._precalcular_campos()
     
     def carregar_dados(self) -> List[Dict[str, Any]]:
         """Carrega os dados do arquivo JSON usando função de alta ordem"""
@@ -22,30 +29,75 @@ class EstatisticasFilmes:
             print(f"❌ Erro ao decodificar o arquivo JSON!")
             return []
     
+    def _precalcular_campos(self):
+        """
+        Extrai, em uma única passagem pelo catálogo, os campos usados nas estatísticas
+        Cada campo vira uma lista paralela indexada pela posição do filme em self.filmes
+        """
+        self._nomes = []
+        self._avaliacoes = []
+        self._duracoes_min = []
+        self._streaming = []
+        self._filmes_por_diretor = defaultdict(list)
+        self._contagem_diretores = defaultdict(int)
+        
+        # Índices dos extremos de duração, acompanhados na mesma passagem (empates ficam com o primeiro)
+        self._idx_mais_longo = self._idx_mais_curto = 0
+        maior_duracao = menor_duracao = None
+        
+        for i, filme in enumerate(self.filmes):
+            nome, diretor = filme['nome'], filme['diretor']
+            minutos = _duracao_em_minutos(filme['duracao'])
+            self._nomes.append(nome)
+            self._avaliacoes.append(filme['avaliacao'])
+            self._duracoes_min.append(minutos)
+            self._streaming.append(filme['streaming'])
+            self._filmes_por_diretor[diretor].append(nome)
+            self._contagem_diretores[diretor] += 1
+            
+            if maior_duracao is None or minutos > maior_duracao:
+                self._idx_mais_longo, maior_duracao = i, minutos
+            if menor_duracao is None or minutos < menor_duracao:
+                self._idx_mais_curto, menor_duracao = i, minutos
+        
+        # Ordenação estável: empates mantêm a ordem original do catálogo
+        self._indices_por_avaliacao = sorted(
+            range(len(self._avaliacoes)), key=self._avaliacoes.__getitem__, reverse=True
+        )
+        # Avaliações em ordem crescente derivadas da mesma ordenação, para a mediana e a busca binária
+        self._avaliacoes_ordenadas = [self._avaliacoes[i] for i in reversed(self._indices_por_avaliacao)]
+        
+        # Reduções numéricas calculadas uma única vez sobre as listas pré-calculadas
+        self._media_avaliacao = self._duracao_media_min = 0.0
+        self._idx_melhor = self._idx_pior = 0
+        if self.filmes:
+            avaliacoes, duracoes = self._avaliacoes, self._duracoes_min
+            self._media_avaliacao = sum(avaliacoes) / len(avaliacoes)
+            self._idx_melhor = avaliacoes.index(max(avaliacoes))
+            self._idx_pior = avaliacoes.index(min(avaliacoes))
+            self._duracao_media_min = sum(duracoes) / len(duracoes)
+    
     def calcular_media_avaliacao(self) -> float:
-        """Calcula a média das avaliações usando funções de alta ordem (map)"""
+        """Calcula a média das avaliações a partir da lista pré-calculada"""
         if not self.filmes:
             return 0.0
         
-        # Usando map para extrair as avaliações
-        avaliacoes = list(map(lambda filme: filme['avaliacao'], self.filmes))
-        return sum(avaliacoes) / len(avaliacoes)
+        return self._media_avaliacao
     
     def calcular_mediana_avaliacao(self) -> float:
-        """Calcula a mediana das avaliações usando funções de alta ordem (sorted, map)"""
+        """Calcula a mediana das avaliações a partir da lista já ordenada no carregamento"""
         if not self.filmes:
             return 0.0
         
-        # Usando sorted e map para ordenar as avaliações
-        avaliacoes = sorted(map(lambda filme: filme['avaliacao'], self.filmes))
+        avaliacoes = self._avaliacoes_ordenadas
         n = len(avaliacoes)
         
-        # Mediana para lista par ou ímpar
-        return (avaliacoes[n//2 - 1] + avaliacoes[n//2]) / 2 if n % 2 == 0 else avaliacoes[n//2]
+        # Mediana sem desvio por paridade: para n ímpar, (n-1)//2 == n//2 e o termo central é somado com ele mesmo
+        return (avaliacoes[(n - 1) // 2] + avaliacoes[n // 2]) / 2
     
-    def filmes_acima_avaliacao(self, limite: float = 6.0, ordenar: bool = True) -> List[str]:
+    def filmes_acima_avaliacao(self, limite: float = 6.0, ordenar: bool = True) -> List[Tuple[str, float]]:
         """
-        Retorna filmes com avaliação acima do limite usando função própria com parâmetros default
+        Retorna (nome, avaliação) dos filmes com avaliação acima do limite usando função própria com parâmetros default
         Parâmetros:
         - limite: float = 6.0 (valor default)
         - ordenar: bool = True (valor default)
@@ -53,53 +105,37 @@ class EstatisticasFilmes:
         if not self.filmes:
             return []
         
-        # Filtra filmes acima do limite
-        filmes_filtrados = [
-            filme for filme in self.filmes 
-            if filme['avaliacao'] > limite
-        ]
+        # Busca binária do limite nas avaliações já ordenadas e fatia os índices ordenados
+        acima = len(self._avaliacoes_ordenadas) - bisect_right(self._avaliacoes_ordenadas, limite)
+        indices = self._indices_por_avaliacao[:acima]
         
-        # Ordena por avaliação (decrescente) se solicitado
-        if ordenar:
-            filmes_filtrados.sort(key=lambda x: x['avaliacao'], reverse=True)
+        # Sem ordenação, os índices selecionados voltam à ordem original do catálogo
+        if not ordenar:
+            indices.sort()
         
-        return [filme['nome'] for filme in filmes_filtrados]
+        nomes, avaliacoes = self._nomes, self._avaliacoes
+        return [(nomes[i], avaliacoes[i]) for i in indices]
     
     def filmes_em_streaming(self) -> List[str]:
-        """Retorna filmes disponíveis em streaming usando list comprehension"""
-        return [
-            filme['nome'] for filme in self.filmes 
-            if filme['streaming']
-        ]
-    
-    def duracao_em_minutos(self, duracao_tuple: Tuple[int, int]) -> int:
-        """Converte tupla (horas, minutos) para minutos totais"""
-        return duracao_tuple[0] * 60 + duracao_tuple[1]
+        """Retorna filmes disponíveis em streaming filtrando os nomes pela lista de flags"""
+        return list(compress(self._nomes, self._streaming))
     
     def extremos_duracao(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Retorna o filme com maior e menor duração
-        Usa funções de alta ordem (max, min, lambda)
+        Usa os índices encontrados na passagem única do carregamento
         """
         if not self.filmes:
             return {}, {}
         
-        # Encontra filmes com maior e menor duração usando lambda
-        mais_longo = max(self.filmes, key=lambda x: self.duracao_em_minutos(x['duracao']))
-        mais_curto = min(self.filmes, key=lambda x: self.duracao_em_minutos(x['duracao']))
-        
-        return mais_longo, mais_curto
+        return self.filmes[self._idx_mais_longo], self.filmes[self._idx_mais_curto]
     
     def moda_diretores(self) -> List[Tuple[str, int]]:
-        """Retorna a moda dos diretores (os que mais dirigiram filmes) usando Counter"""
+        """Retorna a moda dos diretores (os que mais dirigiram filmes) usando a contagem feita no carregamento"""
         if not self.filmes:
             return []
         
-        # Usando list comprehension para extrair diretores
-        diretores = [filme['diretor'] for filme in self.filmes]
-        
-        # Usando Counter para contar ocorrências
-        contador = Counter(diretores)
+        contador = self._contagem_diretores
         
         if not contador:
             return []
@@ -107,12 +143,28 @@ class EstatisticasFilmes:
         # Encontra a contagem máxima
         max_contagem = max(contador.values())
         
-        # Retorna todos os diretores com a contagem máxima
+        # Retorna todos os diretores com a contagem máxima (na ordem de aparição)
         return [
             (diretor, contagem) for diretor, contagem in contador.items() 
             if contagem == max_contagem
         ]
     
+    @property
+    def melhor_avaliado(self) -> Dict[str, Any]:
+        """Filme com a maior avaliação, pelo índice encontrado no carregamento"""
+        if not self.filmes:
+            return {}
+        
+        return self.filmes[self._idx_melhor]
+    
+    @property
+    def pior_avaliado(self) -> Dict[str, Any]:
+        """Filme com a menor avaliação, pelo índice encontrado no carregamento"""
+        if not self.filmes:
+            return {}
+        
+        return self.filmes[self._idx_pior]
+    
     def formatar_duracao(self, duracao_tuple: Tuple[int, int]) -> str:
         """Formata a duração para exibição amigável"""
         horas, minutos = duracao_tuple
@@ -135,17 +187,16 @@ class EstatisticasFilmes:
         
         # Filmes com avaliação > 6 (usando função com parâmetros default)
         filmes_acima_6 = self.filmes_acima_avaliacao()
-        print(f"\n🏆 Filmes com avaliação > 6.0: {len(filmes_acima_6)}")
-        for i, filme in enumerate(filmes_acima_6, 1):
-            # Encontra a avaliação do filme para exibir
-            avaliacao = next((f['avaliacao'] for f in self.filmes if f['nome'] == filme), "N/A")
-            print(f"   {i:2d}. {filme} ⭐ {avaliacao}")
+        # Cada seção é montada em memória e escrita com um único print
+        linhas = [f"\n🏆 Filmes com avaliação > 6.0: {len(filmes_acima_6)}"]
+        linhas.extend(f"   {i:2d}. {nome} ⭐ {avaliacao}" for i, (nome, avaliacao) in enumerate(filmes_acima_6, 1))
+        print("\n".join(linhas))
         
-        # Filmes em streaming (usando list comprehension)
+        # Filmes em streaming (filtrando os nomes pelas flags com compress)
         filmes_streaming = self.filmes_em_streaming()
-        print(f"\n📺 Filmes disponíveis em streaming: {len(filmes_streaming)}")
-        for i, filme in enumerate(filmes_streaming, 1):
-            print(f"   {i:2d}. {filme}")
+        linhas = [f"\n📺 Filmes disponíveis em streaming: {len(filmes_streaming)}"]
+        linhas.extend(f"   {i:2d}. {filme}" for i, filme in enumerate(filmes_streaming, 1))
+        print("\n".join(linhas))
         
         # Extremos de duração
         mais_longo, mais_curto = self.extremos_duracao()
@@ -161,14 +212,13 @@ class EstatisticasFilmes:
         # Moda dos diretores
         moda_diretores = self.moda_diretores()
         if moda_diretores:
-            print(f"\n🎭 Diretor(es) mais frequente(s):")
+            linhas = [f"\n🎭 Diretor(es) mais frequente(s):"]
             for diretor, contagem in moda_diretores:
-                print(f"   👨‍💼 {diretor}: {contagem} filme(s)")
+                linhas.append(f"   👨‍💼 {diretor}: {contagem} filme(s)")
                 
                 # Lista filmes desse diretor
-                filmes_diretor = [f['nome'] for f in self.filmes if f['diretor'] == diretor]
-                for filme in filmes_diretor:
-                    print(f"      🎬 {filme}")
+                linhas.extend(f"      🎬 {filme}" for filme in self._filmes_por_diretor[diretor])
+            print("\n".join(linhas))
         
         # Estatísticas adicionais
         self.exibir_estatisticas_adicionais()
@@ -180,21 +230,21 @@ class EstatisticasFilmes:
         print("="*70)
         
         # Porcentagem em streaming
-        total_streaming = len(self.filmes_em_streaming())
-        porcentagem = (total_streaming / len(self.filmes)) * 100
+        # Conta direto na lista de flags, sem montar a lista de nomes
+        total_streaming = sum(self._streaming)
+        porcentagem = (total_streaming / len(self._streaming)) * 100
         print(f"📊 Porcentagem em streaming: {porcentagem:.1f}%")
         
         # Filme melhor avaliado
-        melhor_avaliado = max(self.filmes, key=lambda x: x['avaliacao'])
+        melhor_avaliado = self.melhor_avaliado
         print(f"🏅 Melhor avaliado: {melhor_avaliado['nome']} ⭐ {melhor_avaliado['avaliacao']}")
         
         # Filme pior avaliado
-        pior_avaliado = min(self.filmes, key=lambda x: x['avaliacao'])
+        pior_avaliado = self.pior_avaliado
         print(f"⚫ Pior avaliado: {pior_avaliado['nome']} ⭐ {pior_avaliado['avaliacao']}")
         
         # Duração média
-        duracoes = [self.duracao_em_minutos(f['duracao']) for f in self.filmes]
-        duracao_media_min = sum(duracoes) / len(duracoes)
+        duracao_media_min = self._duracao_media_min
         horas = int(duracao_media_min // 60)
         minutos = int(duracao_media_min % 60)
         print(f"⏰ Duração média: {horas}h{minutos:02d}min")
@@ -213,9 +263,9 @@ class EstatisticasFilmes:
         # Com limite personalizado
         print("\n📋 Com limite=7.5, ordenar=True:")
         filmes_75 = self.filmes_acima_avaliacao(limite=7.5)
-        print(f"   Encontrados: {len(filmes_75)} filmes")
-        for filme in filmes_75:
-            print(f"      🎬 {filme}")
+        linhas = [f"   Encontrados: {len(filmes_75)} filmes"]
+        linhas.extend(f"      🎬 {nome}" for nome, _ in filmes_75)
+        print("\n".join(linhas))
         
         # Sem ordenação
         print("\n📋 Com limite=6.0, ordenar=False:")